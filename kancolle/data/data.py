@@ -1,5 +1,6 @@
 """Data module."""
 import json
+from concurrent.futures import ThreadPoolExecutor
 from os import path
 
 import requests  # type: ignore
@@ -18,10 +19,15 @@ def download():
         "slotitem.json": "slotitem/all.json",
     }
 
-    for filename, _path in file_data.items():
-        url = KC_DATA_URL + _path
-        data = session.get(url).json()
-        save_data(data, filename)
+    def fetch(_path):
+        return session.get(KC_DATA_URL + _path).json()
+
+    # fetch all files concurrently to overlap network latency
+    with ThreadPoolExecutor(max_workers=len(file_data)) as executor:
+        results = executor.map(fetch, file_data.values())
+
+        for filename, data in zip(file_data, results):
+            save_data(data, filename)
 
 
 def save_data(data, file_name):
@@ -8,6 +8,8 @@ class Ship(object):
 
     """
 
+    __slots__ = ('id', 'name', 'class_id', 'type_id')
+
     def __init__(self, ship_id, name, class_id, type_id) -> None:
         """Initializes an instance of the class.
 
@@ -9,6 +9,8 @@ class ShipClass(object):
 
     """
 
+    __slots__ = ('id', 'name', 'chinese_name')
+
     def __init__(self, class_id, name, chinese_name):
         """Initializes the instance with the specified class_id, name, and chinese_name. It doesn't return any value.
 
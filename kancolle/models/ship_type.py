@@ -8,6 +8,8 @@ class ShipType(object):
 
     """
 
+    __slots__ = ('id', 'name', 'chinese_name', 'english_name')
+
     def __init__(self, type_id, name, chinese_name, english_name):
         """Initialize the instance variables.
 
@@ -4,6 +4,8 @@
 class SlotItem:
     """Slot Item Model."""
 
+    __slots__ = ('id', 'name', 'type_id_list')
+
     def __init__(self, item_id, name, type_id_list) -> None:
         """Initializes an instance of the class.
 